@@ -310,10 +310,8 @@ def bake_animation(
     bpy.context.view_layer.objects.active = armature
     bpy.ops.object.mode_set(mode='POSE')
 
-    # Select all pose bones
-    bpy.ops.pose.select_all(action='SELECT')
-
-    # Bake the animation
+    # Bake the animation (every bone: only_selected=False makes a
+    # select-all pass unnecessary)
     bpy.ops.nla.bake(
         frame_start=bake_start,
         frame_end=bake_end,
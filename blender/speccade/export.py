@@ -17,22 +17,28 @@ deterministic output for reproducible asset generation.
 """
 
 import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, cast
+from typing import Any, Dict, Iterator, List, Optional, Tuple, cast
 
 # Blender modules - only available when running inside Blender
 try:
     import bpy  # type: ignore
     import bmesh  # type: ignore
+    import numpy as np  # type: ignore
     from mathutils import Vector  # type: ignore
     BLENDER_AVAILABLE = True
 except ImportError:
     bpy = cast(Any, object())
     bmesh = cast(Any, object())
+    np = cast(Any, object())
     Vector = cast(Any, object())
     BLENDER_AVAILABLE = False
 
 # Import from sibling modules
+from .image_io import write_png_rgba8
 from .metrics import compute_mesh_metrics
 
 
@@ -138,8 +144,13 @@ def export_glb(
     include_skin_weights: bool = True,
     triangulate: bool = False,
     export_tangents: bool = False,
+    apply_modifiers: bool = True,
 ) -> None:
-    """Export scene to GLB format."""
+    """Export scene to GLB format.
+
+    Pass apply_modifiers=False when every mesh already has its modifier stack
+    baked in, so the exporter reads the mesh data instead of re-evaluating it.
+    """
 
     # Best-effort triangulation for determinism and parity with metrics.
     # We apply it directly to meshes (not as an export-only option) because the
@@ -166,7 +177,7 @@ def export_glb(
     export_settings = {
         'filepath': str(output_path),
         'export_format': 'GLB',
-        'export_apply': True,
+        'export_apply': bool(apply_modifiers),
         'export_texcoords': bool(include_uvs),
         'export_normals': bool(include_normals),
         'export_skins': bool(include_skin_weights),
@@ -184,6 +195,12 @@ def export_glb(
 
     if include_animation:
         export_settings['export_current_frame'] = False
+        # Drop redundant keyframes (the exporter default on recent Blender,
+        # explicit for older versions) and sample armatures with viewport
+        # evaluation of other objects disabled, which speeds up animation
+        # export. Both are filtered out where unsupported.
+        export_settings['export_optimize_animation_size'] = True
+        export_settings['export_optimize_armature_disable_viewport'] = True
 
     export_settings = _normalize_operator_kwargs(bpy.ops.export_scene.gltf, export_settings)
     bpy.ops.export_scene.gltf(**export_settings)
@@ -636,7 +653,6 @@ def analyze_navmesh(
     """
     walkable_slope_max = navmesh_spec.get("walkable_slope_max", 45.0)
     stair_detection = navmesh_spec.get("stair_detection", False)
-    stair_step_height = navmesh_spec.get("stair_step_height", 0.3)
 
     # Convert slope threshold to radians and compute the minimum Z component
     # of the normal for a face to be considered walkable
@@ -644,39 +660,15 @@ def analyze_navmesh(
     slope_rad = math.radians(walkable_slope_max)
     min_normal_z = math.cos(slope_rad)
 
-    # Get evaluated mesh data
-    depsgraph = bpy.context.evaluated_depsgraph_get()
-    obj_eval = obj.evaluated_get(depsgraph)
-    mesh = obj_eval.to_mesh()
+    # Evaluated polygon normals (and face centers for stair detection)
+    normals, centers = _evaluated_polygon_arrays(obj, with_centers=stair_detection)
+    poly_count = len(normals)
 
-    walkable_count = 0
-    non_walkable_count = 0
-    walkable_heights = []  # Z positions of walkable surface centers (for stair detection)
-
-    for poly in mesh.polygons:
-        # Get face normal in world space
-        # The polygon normal is in local space, so transform it
-        normal_local = poly.normal
-        # For world space, we need to transform by the object's rotation matrix (not translation)
-        normal_world = obj.matrix_world.to_3x3() @ normal_local
-        normal_world.normalize()
-
-        # Check if face is walkable based on slope
-        # A face is walkable if its normal Z component >= min_normal_z (pointing mostly up)
-        if normal_world.z >= min_normal_z:
-            walkable_count += 1
-            if stair_detection:
-                # Record the center Z position of this face for stair analysis
-                center = poly.center
-                world_center = obj.matrix_world @ center
-                walkable_heights.append(world_center.z)
-        else:
-            non_walkable_count += 1
-
-    obj_eval.to_mesh_clear()
-
-    total_faces = walkable_count + non_walkable_count
-    walkable_percentage = (walkable_count / total_faces * 100.0) if total_faces > 0 else 0.0
+    rot3 = obj.matrix_world.to_3x3()
+    identity_rotation, walkable = _classify_walkable_faces(normals, rot3, min_normal_z)
+    walkable_count = int(np.count_nonzero(walkable))
+    non_walkable_count = poly_count - walkable_count
+    walkable_percentage = (walkable_count / poly_count * 100.0) if poly_count > 0 else 0.0
 
     metrics = {
         "walkable_face_count": walkable_count,
@@ -684,16 +676,108 @@ def analyze_navmesh(
         "walkable_percentage": round(walkable_percentage, 2),
     }
 
+    # Without stair detection, world positions are never needed.
+    if not stair_detection or walkable_count == 0:
+        return metrics
+
+    # Record the world-space center Z of every walkable face for stair
+    # analysis. Only the Z row of the homogeneous transform is needed.
+    centers = centers[walkable]
+    # Heights land in one typed buffer sized to the walkable face count
+    walkable_heights = np.empty(walkable_count, dtype=np.float64)
+    if identity_rotation:
+        np.add(centers[:, 2], obj.matrix_world[2][3], out=walkable_heights)
+    else:
+        homogeneous = np.empty((walkable_count, 4), dtype=np.float64)
+        homogeneous[:, :3] = centers
+        homogeneous[:, 3] = 1.0
+        matrix_row_z = np.array(obj.matrix_world[2], dtype=np.float64)
+        np.matmul(homogeneous, matrix_row_z, out=walkable_heights)
+
     # Stair detection: look for clusters of walkable surfaces at regular height intervals
-    if stair_detection and walkable_heights:
-        stair_candidates = _detect_stair_candidates(walkable_heights, stair_step_height)
-        metrics["stair_candidates"] = stair_candidates
+    stair_step_height = navmesh_spec.get("stair_step_height", 0.3)
+    metrics["stair_candidates"] = _detect_stair_candidates(walkable_heights, stair_step_height)
 
     return metrics
 
 
+def _evaluated_polygon_arrays(obj: Any, with_centers: bool) -> Tuple[Any, Any]:
+    """
+    Get the evaluated mesh's polygon normals and, optionally, centers.
+
+    Both are local-space float32 arrays of shape (N, 3), copied out in bulk
+    with foreach_get from a single evaluated mesh.
+
+    Returns:
+        Tuple of (normals, centers); centers is None unless with_centers.
+    """
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    obj_eval = obj.evaluated_get(depsgraph)
+    mesh = obj_eval.to_mesh()
+    try:
+        poly_count = len(mesh.polygons)
+        normals = np.empty(poly_count * 3, dtype=np.float32)
+        mesh.polygons.foreach_get("normal", normals)
+        centers = None
+        if with_centers:
+            centers = np.empty(poly_count * 3, dtype=np.float32)
+            mesh.polygons.foreach_get("center", centers)
+            centers = centers.reshape(-1, 3)
+    finally:
+        obj_eval.to_mesh_clear()
+
+    return normals.reshape(-1, 3), centers
+
+
+def _classify_walkable_faces(
+    normals: Any,
+    rot3: Any,
+    min_normal_z: float
+) -> Tuple[bool, Any]:
+    """
+    Classify local-space polygon normals as walkable in world space.
+
+    Only the world-space Z of each normal is needed for the slope test, so the
+    common cases dot the normals against the Z row of the rotation matrix
+    instead of transforming full vectors.
+
+    Args:
+        normals: (N, 3) float32 array of local-space unit polygon normals.
+        rot3: The object's 3x3 world rotation/scale matrix.
+        min_normal_z: Minimum world-space normal Z for a walkable face.
+
+    Returns:
+        Tuple of (identity_rotation, walkable_mask).
+    """
+    # Polygon normals are already unit length, so when the matrix scales
+    # uniformly the transformed normal only needs dividing by that scale
+    # rather than a full normalize.
+    scale = rot3.to_scale()
+    uniform_scale = max(abs(scale.x - scale.y), abs(scale.y - scale.z)) < 1e-6 and scale.x > 0.0
+    rot3_np = np.array(rot3, dtype=np.float32)
+    identity_rotation = bool(np.allclose(rot3_np, np.identity(3, dtype=np.float32), rtol=0.0, atol=1e-7))
+
+    # A face is walkable if its normal Z component >= min_normal_z (pointing mostly up)
+    if identity_rotation:
+        # Unrotated, unscaled objects (floors, terrain) need no transform at all.
+        return identity_rotation, normals[:, 2] >= min_normal_z
+
+    normal_z = normals @ rot3_np[2]
+    if uniform_scale:
+        return identity_rotation, normal_z >= min_normal_z * scale.x
+
+    # Non-uniform scale changes normal lengths per face; compare the unnormalized
+    # Z against the threshold scaled by each length instead of dividing.
+    lengths = np.linalg.norm(normals @ rot3_np.T, axis=1)
+    walkable = normal_z >= min_normal_z * lengths
+    if min_normal_z > 0.0:
+        # Degenerate faces with zero-length normals are never walkable.
+        walkable &= lengths > 0.0
+    return identity_rotation, walkable
+
+
 def _detect_stair_candidates(
-    walkable_heights: List[float],
+    walkable_heights: Any,
     step_height: float
 ) -> int:
     """
@@ -703,51 +787,37 @@ def _detect_stair_candidates(
     differences approximately equal to the step height threshold.
 
     Args:
-        walkable_heights: List of Z positions of walkable surface centers.
+        walkable_heights: Array (or sequence) of Z positions of walkable surface centers.
         step_height: Expected height difference between stair steps.
 
     Returns:
         Number of detected stair candidate surfaces.
     """
-    if not walkable_heights or step_height <= 0:
+    if len(walkable_heights) == 0 or step_height <= 0:
         return 0
 
-    # Sort heights and cluster into potential steps
-    sorted_heights = sorted(walkable_heights)
+    heights = np.sort(np.asarray(walkable_heights, dtype=np.float64))
 
     # Tolerance for step height matching (allow some variation)
     tolerance = step_height * 0.3
 
-    stair_candidates = 0
-    height_clusters = []
-    current_cluster = [sorted_heights[0]]
-
-    # Group heights into clusters (faces at similar heights)
-    for h in sorted_heights[1:]:
-        if abs(h - current_cluster[-1]) < tolerance * 0.5:
-            # Same level (within 15% of step height)
-            current_cluster.append(h)
-        else:
-            # New cluster
-            if current_cluster:
-                avg_height = sum(current_cluster) / len(current_cluster)
-                height_clusters.append((avg_height, len(current_cluster)))
-            current_cluster = [h]
+    # Cluster means lie within the overall height span, so a span too small
+    # for even one matching step (e.g. a flat floor) cannot produce stairs.
+    if heights[-1] - heights[0] <= step_height - tolerance:
+        return 0
 
-    if current_cluster:
-        avg_height = sum(current_cluster) / len(current_cluster)
-        height_clusters.append((avg_height, len(current_cluster)))
+    # Group sorted heights into clusters (faces at similar heights): a gap of
+    # 15% of the step height or more between neighbours starts a new level.
+    run_starts = np.flatnonzero(np.diff(heights, prepend=-np.inf) >= tolerance * 0.5)
+    cluster_counts = np.diff(np.append(run_starts, len(heights)))
+    cluster_means = np.add.reduceat(heights, run_starts) / cluster_counts
 
     # Look for sequences of clusters with step_height spacing
-    if len(height_clusters) >= 2:
-        for i in range(len(height_clusters) - 1):
-            height_diff = height_clusters[i + 1][0] - height_clusters[i][0]
-            if abs(height_diff - step_height) < tolerance:
-                # This looks like a stair step
-                stair_candidates += height_clusters[i][1]
-        # Include the top step if the previous one matched
-        if stair_candidates > 0:
-            stair_candidates += height_clusters[-1][1]
+    step_matches = np.abs(np.diff(cluster_means) - step_height) < tolerance
+    stair_candidates = int(cluster_counts[:-1][step_matches].sum())
+    # Include the top step if the previous one matched
+    if stair_candidates > 0:
+        stair_candidates += int(cluster_counts[-1])
 
     return stair_candidates
 
@@ -765,7 +835,8 @@ def bake_textures(
     """
     Bake texture maps (normal, AO, curvature) from a mesh.
 
-    Uses Cycles CPU renderer for deterministic output.
+    Uses the Cycles CPU renderer for deterministic output, unless GPU baking
+    is enabled through the SPECCADE_BAKE_DEVICE environment variable.
 
     Args:
         obj: The target mesh object (low-poly) to bake onto.
@@ -790,17 +861,23 @@ def bake_textures(
     resolution = baking_spec.get("resolution", [1024, 1024])
     high_poly_source = baking_spec.get("high_poly_source")
 
-    # Switch to Cycles for baking (CPU only for determinism)
-    bpy.context.scene.render.engine = 'CYCLES'
-    bpy.context.scene.cycles.device = 'CPU'
-    bpy.context.scene.cycles.samples = 128  # Reasonable quality for baking
+    # Switch to Cycles for baking (CPU unless GPU baking is opted into)
+    scene = bpy.context.scene
+    scene.render.engine = 'CYCLES'
+    scene.cycles.device = _select_bake_device()
+    if scene.cycles.samples != 128:
+        scene.cycles.samples = 128  # Reasonable quality for baking
+    _configure_bake_tile_size(scene)
 
     # Ensure the mesh has UVs
-    if not obj.data.uv_layers:
-        # Auto-unwrap if no UVs exist
+    if not _mesh_has_usable_uvs(obj.data):
+        # Auto-unwrap if no usable UVs exist. Selecting through mesh data
+        # carries into edit mode, saving a select_all operator call.
+        mesh = obj.data
+        for elements in (mesh.vertices, mesh.edges, mesh.polygons):
+            elements.foreach_set("select", np.ones(len(elements), dtype=bool))
         bpy.context.view_layer.objects.active = obj
         bpy.ops.object.mode_set(mode='EDIT')
-        bpy.ops.mesh.select_all(action='SELECT')
         bpy.ops.uv.smart_project(angle_limit=66.0)
         bpy.ops.object.mode_set(mode='OBJECT')
 
@@ -829,76 +906,73 @@ def bake_textures(
     # Create or get the bake material
     mat = _get_or_create_bake_material(obj)
 
-    for bake_type in bake_types:
-        # Create image for baking
-        img_name = f"{base_name}_{bake_type}"
-        img_width, img_height = resolution
-
-        # Delete existing image if it exists
-        if img_name in bpy.data.images:
-            bpy.data.images.remove(bpy.data.images[img_name])
-
-        # Create new image
-        if bake_type in ["normal"]:
-            # Normal maps need specific color space
-            img = bpy.data.images.new(img_name, width=img_width, height=img_height, float_buffer=True)
-            img.colorspace_settings.name = 'Non-Color'
-        else:
-            img = bpy.data.images.new(img_name, width=img_width, height=img_height)
-            if bake_type != "combined":
-                img.colorspace_settings.name = 'Non-Color'
-
-        # Set up the image node in the material for baking target
-        _setup_bake_target_node(mat, img)
-
-        # Configure bake settings
-        bpy.context.scene.render.bake.use_pass_direct = False
-        bpy.context.scene.render.bake.use_pass_indirect = False
-        bpy.context.scene.render.bake.use_pass_color = True
-        bpy.context.scene.render.bake.margin = margin
-        bpy.context.scene.render.bake.margin_type = 'EXTEND'
-
-        # Select objects for baking
-        bpy.ops.object.select_all(action='DESELECT')
-        obj.select_set(True)
-        bpy.context.view_layer.objects.active = obj
+    # Configure bake settings once; none of them depend on the bake type
+    bake_settings = scene.render.bake
+    bake_settings.use_pass_direct = False
+    bake_settings.use_pass_indirect = False
+    bake_settings.use_pass_color = True
+    bake_settings.margin = margin
+    bake_settings.margin_type = 'EXTEND'
 
-        # Set up for selected-to-active baking if high-poly source exists
-        use_selected_to_active = high_poly_obj is not None
+    # Select objects for baking
+    bpy.ops.object.select_all(action='DESELECT')
+    obj.select_set(True)
+    bpy.context.view_layer.objects.active = obj
 
-        if use_selected_to_active:
-            high_poly_obj.select_set(True)
-            bpy.context.scene.render.bake.use_selected_to_active = True
-            bpy.context.scene.render.bake.cage_extrusion = ray_distance
-        else:
-            bpy.context.scene.render.bake.use_selected_to_active = False
-
-        # Perform the bake based on type
-        if bake_type == "normal":
-            bpy.ops.object.bake(type='NORMAL')
-        elif bake_type == "ao":
-            bpy.ops.object.bake(type='AO')
-        elif bake_type == "curvature":
-            # Curvature is not a native Blender bake type
-            # We emulate it using pointiness from geometry node or bake from a material
-            _bake_curvature(obj, img, margin)
-        elif bake_type == "combined":
-            bpy.ops.object.bake(type='COMBINED')
-
-        # Save the baked image
-        output_filename = f"{base_name}_{bake_type}.png"
-        output_path = out_root / output_filename
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        img.filepath_raw = str(output_path)
-        img.file_format = 'PNG'
-        img.save()
-
-        baked_maps.append({
-            "type": bake_type,
-            "path": output_filename,
-            "resolution": [img_width, img_height],
-        })
+    # Set up for selected-to-active baking if high-poly source exists
+    if high_poly_obj is not None:
+        high_poly_obj.select_set(True)
+        bake_settings.use_selected_to_active = True
+        bake_settings.cage_extrusion = ray_distance
+    else:
+        bake_settings.use_selected_to_active = False
+
+    img_width, img_height = resolution
+    out_root.mkdir(parents=True, exist_ok=True)
+
+    # PNG encoding runs on a single background thread so it overlaps with the
+    # next bake; all bpy calls stay on the main thread.
+    pending_writes = []
+    bake_targets = _BakeTargetImages(base_name, img_width, img_height)
+    bake_objects = [obj] if high_poly_obj is None else [obj, high_poly_obj]
+    with _bake_session(scene), ThreadPoolExecutor(max_workers=1) as png_writer:
+        for bake_type in bake_types:
+            # Reuse the bake target image for this buffer format
+            img = bake_targets.acquire(bake_type)
+
+            # Set up the image node in the material for baking target
+            _setup_bake_target_node(mat, img)
+
+            # Perform the bake based on type
+            if bake_type == "normal":
+                _run_bake(obj, bake_objects, 'NORMAL')
+            elif bake_type == "ao":
+                _run_bake(obj, bake_objects, 'AO')
+            elif bake_type == "curvature":
+                # Curvature is not a native Blender bake type
+                # We emulate it using pointiness from geometry node or bake from a material
+                _bake_curvature(obj, bake_objects, img, margin)
+            elif bake_type == "combined":
+                _run_bake(obj, bake_objects, 'COMBINED')
+
+            # Save the baked image
+            output_filename = f"{base_name}_{bake_type}.png"
+            output_path = out_root / output_filename
+
+            # Encode the PNG on the writer thread while the next map bakes
+            pending_writes.append(png_writer.submit(
+                write_png_rgba8, output_path, _image_rgba8_bytes(img), img_width, img_height
+            ))
+
+            baked_maps.append({
+                "type": bake_type,
+                "path": output_filename,
+                "resolution": [img_width, img_height],
+            })
+
+        # Surface any write errors before reporting success
+        for pending in pending_writes:
+            pending.result()
 
     # Clean up high-poly object if we imported it
     if high_poly_obj:
@@ -911,6 +985,190 @@ def bake_textures(
     }
 
 
+# Environment variable that opts bake jobs into GPU Cycles. GPU output is not
+# bit-identical to CPU output, so CPU stays the default.
+BAKE_DEVICE_ENV = "SPECCADE_BAKE_DEVICE"
+
+# GPU backends in order of preference. CUDA comes before OptiX because older
+# Blender releases cannot bake with OptiX.
+GPU_BAKE_BACKENDS = ('CUDA', 'OPTIX', 'HIP', 'METAL', 'ONEAPI')
+
+
+def _select_bake_device() -> str:
+    """
+    Pick the Cycles device for baking.
+
+    Returns 'GPU' only when SPECCADE_BAKE_DEVICE=GPU is set and a supported
+    GPU backend is available, in which case that backend is enabled in the
+    Cycles preferences. Otherwise returns 'CPU'.
+    """
+    if os.environ.get(BAKE_DEVICE_ENV, "CPU").upper() != "GPU":
+        return 'CPU'
+
+    addon = bpy.context.preferences.addons.get("cycles")
+    if addon is None:
+        return 'CPU'
+    prefs = addon.preferences
+    if hasattr(prefs, "refresh_devices"):
+        prefs.refresh_devices()
+    else:
+        prefs.get_devices()
+
+    available = {device.type for device in prefs.devices}
+    backend = next((b for b in GPU_BAKE_BACKENDS if b in available), None)
+    if backend is None:
+        print(f"Warning: {BAKE_DEVICE_ENV}=GPU but no GPU device found, baking on CPU")
+        return 'CPU'
+
+    prefs.compute_device_type = backend
+    for device in prefs.devices:
+        device.use = device.type == backend
+    return 'GPU'
+
+
+# Cycles tile size per compute device on the pre-3.0 tile_x/tile_y path:
+# small tiles keep CPU threads busy, large tiles saturate GPUs.
+BAKE_TILE_SIZES = {
+    'CPU': 32,
+    'GPU': 256,
+}
+
+
+def _configure_bake_tile_size(scene: Any) -> None:
+    """Set the Cycles tile size to suit the active bake device.
+
+    Only Blender versions before 3.0 are changed. Cycles X (3.0+) auto-tiles
+    at 2048 by default, which bakes typical textures as a single tile, so its
+    tile settings are left alone.
+    """
+    cycles = scene.cycles
+    if hasattr(cycles, "tile_size"):
+        return
+    tile_size = BAKE_TILE_SIZES.get(cycles.device, BAKE_TILE_SIZES['CPU'])
+    scene.render.tile_x = tile_size
+    scene.render.tile_y = tile_size
+
+
+@contextmanager
+def _bake_session(scene: Any) -> Iterator[None]:
+    """
+    Suspend global undo and lock the interface for a run of bake operators.
+
+    Every operator call otherwise pushes an undo snapshot, whose cost grows
+    with scene size, and the UI may redraw between bakes. Both settings are
+    restored on exit.
+    """
+    edit_prefs = bpy.context.preferences.edit
+    saved_undo = edit_prefs.use_global_undo
+    saved_lock = scene.render.use_lock_interface
+    edit_prefs.use_global_undo = False
+    scene.render.use_lock_interface = True
+    try:
+        yield
+    finally:
+        edit_prefs.use_global_undo = saved_undo
+        scene.render.use_lock_interface = saved_lock
+
+
+def _run_bake(obj: Any, bake_objects: List[Any], bake_type: str) -> None:
+    """
+    Run a Cycles bake of bake_type onto obj.
+
+    Uses EXEC_DEFAULT to skip the operator's invoke path and, on Blender 3.2+,
+    an explicit context override so the active/selected objects are not
+    looked up from the view layer.
+    """
+    if hasattr(bpy.context, "temp_override"):
+        with bpy.context.temp_override(active_object=obj, selected_objects=bake_objects):
+            bpy.ops.object.bake('EXEC_DEFAULT', type=bake_type)
+    else:
+        bpy.ops.object.bake('EXEC_DEFAULT', type=bake_type)
+
+
+def _mesh_has_usable_uvs(mesh: Any) -> bool:
+    """
+    Check whether the mesh's active UV layer can be baked onto.
+
+    A layer whose coordinates are all collapsed onto a single point (e.g. a
+    freshly added, never unwrapped layer) is treated the same as no layer.
+    """
+    uv_layer = mesh.uv_layers.active
+    if uv_layer is None:
+        return False
+    loop_count = len(mesh.loops)
+    if loop_count == 0:
+        return True
+    uvs = np.empty(loop_count * 2, dtype=np.float32)
+    uv_layer.data.foreach_get("uv", uvs)
+    return bool(np.ptp(uvs.reshape(-1, 2), axis=0).max() > 0.0)
+
+
+class _BakeTargetImages:
+    """
+    Bake target images shared across bake types.
+
+    Pixels are copied out right after each bake, so one float image (normal
+    maps) and one byte image (everything else) are enough. Reusing them avoids
+    reallocating a full-resolution buffer per map; a reused image is cleared
+    back to the opaque black that a new image starts with.
+    """
+
+    def __init__(self, base_name: str, width: int, height: int):
+        self._base_name = base_name
+        self._width = width
+        self._height = height
+        self._images: Dict[bool, Tuple[Any, str]] = {}
+        self._cleared_pixels = None
+
+    def acquire(self, bake_type: str) -> Any:
+        """Return a cleared image with the buffer format and color space for bake_type."""
+        # Normal maps need a float buffer
+        float_buffer = bake_type == "normal"
+        entry = self._images.get(float_buffer)
+        if entry is None:
+            img_name = f"{self._base_name}_bake_float" if float_buffer else f"{self._base_name}_bake"
+            # Delete existing image if it exists
+            if img_name in bpy.data.images:
+                bpy.data.images.remove(bpy.data.images[img_name])
+            img = bpy.data.images.new(
+                img_name, width=self._width, height=self._height, float_buffer=float_buffer
+            )
+            entry = (img, img.colorspace_settings.name)
+            self._images[float_buffer] = entry
+            reused = False
+        else:
+            reused = True
+        img, default_colorspace = entry
+
+        # Combined maps keep the image's default (color) space; data maps are Non-Color
+        colorspace = default_colorspace if bake_type == "combined" else 'Non-Color'
+        if img.colorspace_settings.name != colorspace:
+            img.colorspace_settings.name = colorspace
+
+        if reused:
+            if self._cleared_pixels is None:
+                cleared = np.zeros((self._width * self._height, 4), dtype=np.float32)
+                cleared[:, 3] = 1.0
+                self._cleared_pixels = cleared.ravel()
+            img.pixels.foreach_set(self._cleared_pixels)
+        return img
+
+
+def _image_rgba8_bytes(img: Any) -> bytes:
+    """
+    Read a Blender image as top-down 8-bit RGBA bytes.
+
+    Mirrors Blender's own float-to-byte conversion when saving (clamp, then
+    round half up) so the written PNG matches Image.save() output.
+    """
+    width, height = img.size[0], img.size[1]
+    pixels = np.empty(width * height * 4, dtype=np.float32)
+    img.pixels.foreach_get(pixels)
+    rgba8 = (np.clip(pixels, 0.0, 1.0) * 255.0 + 0.5).astype(np.uint8)
+    # Blender stores rows bottom-up; PNG rows are top-down.
+    return rgba8.reshape(height, width * 4)[::-1].tobytes()
+
+
 def _get_or_create_bake_material(obj: Any) -> Any:
     """Get or create a material for baking on the object."""
     if obj.data.materials:
@@ -945,29 +1203,27 @@ def _setup_bake_target_node(mat: Any, img: Any) -> None:
     nodes.active = img_node
 
 
-def _bake_curvature(obj: Any, img: Any, margin: int) -> None:
+# Name of the shared material used for curvature bakes.
+CURVATURE_BAKE_MATERIAL = "SpecCadeCurvatureBake"
+
+
+def _get_curvature_bake_material() -> Any:
     """
-    Bake curvature map using geometry pointiness.
+    Get or create the shared curvature bake material.
 
-    Since Blender doesn't have a native curvature bake type, we use
-    a shader that outputs the Geometry > Pointiness value.
+    The node graph (Geometry pointiness -> color ramp -> emission) is built
+    once and stays wired; later bakes only rebind the BakeTarget image.
     """
-    mat = obj.data.materials[0] if obj.data.materials else None
-    if not mat:
-        return
+    mat = bpy.data.materials.get(CURVATURE_BAKE_MATERIAL)
+    if mat is not None:
+        return mat
 
+    mat = bpy.data.materials.new(name=CURVATURE_BAKE_MATERIAL)
+    mat.use_nodes = True
     nodes = mat.node_tree.nodes
     links = mat.node_tree.links
 
-    # Store original output link
-    output_node = None
-    original_surface_input = None
-    for node in nodes:
-        if node.type == 'OUTPUT_MATERIAL':
-            output_node = node
-            if node.inputs['Surface'].links:
-                original_surface_input = node.inputs['Surface'].links[0].from_socket
-            break
+    output_node = next(node for node in nodes if node.type == 'OUTPUT_MATERIAL')
 
     # Create geometry node for pointiness
     geom_node = nodes.new(type='ShaderNodeNewGeometry')
@@ -991,20 +1247,50 @@ def _bake_curvature(obj: Any, img: Any, margin: int) -> None:
     links.new(ramp_node.outputs['Color'], emit_node.inputs['Color'])
     links.new(emit_node.outputs['Emission'], output_node.inputs['Surface'])
 
-    # Configure bake settings for emit
-    bpy.context.scene.render.bake.margin = margin
+    return mat
 
-    # Bake emit (which now outputs our curvature)
-    bpy.ops.object.bake(type='EMIT')
 
-    # Restore original material connection
-    if original_surface_input:
-        links.new(original_surface_input, output_node.inputs['Surface'])
+def _bake_curvature(obj: Any, bake_objects: List[Any], img: Any, margin: int) -> None:
+    """
+    Bake curvature map using geometry pointiness.
+
+    Since Blender doesn't have a native curvature bake type, we temporarily
+    swap in a material that emits the Geometry > Pointiness value.
+    """
+    if not obj.data.materials:
+        return
+
+    curvature_mat = _get_curvature_bake_material()
+    _setup_bake_target_node(curvature_mat, img)
+
+    original_mat = obj.data.materials[0]
+    obj.data.materials[0] = curvature_mat
+    try:
+        # Configure bake settings for emit
+        bpy.context.scene.render.bake.margin = margin
+
+        # Bake emit (which now outputs our curvature)
+        _run_bake(obj, bake_objects, 'EMIT')
+    finally:
+        # Restore original material
+        obj.data.materials[0] = original_mat
 
-    # Clean up temporary nodes
-    nodes.remove(geom_node)
-    nodes.remove(ramp_node)
-    nodes.remove(emit_node)
+
+def _select_only(objects: List[Any]) -> None:
+    """
+    Make objects the exact selection in the active view layer.
+
+    Objects expose selection only through select_set(), so there is no
+    foreach_set path. Instead of the select_all operator, only objects whose
+    state actually changes are touched.
+    """
+    keep = set(objects)
+    for selected in bpy.context.selected_objects:
+        if selected not in keep:
+            selected.select_set(False)
+    for o in objects:
+        if not o.select_get():
+            o.select_set(True)
 
 
 def export_glb_with_lods(
@@ -1022,9 +1308,7 @@ def export_glb_with_lods(
         export_tangents: Whether to export tangents.
     """
     # Ensure only LOD objects are selected
-    bpy.ops.object.select_all(action='DESELECT')
-    for lod_obj in lod_objects:
-        lod_obj.select_set(True)
+    _select_only(lod_objects)
 
     if lod_objects:
         bpy.context.view_layer.objects.active = lod_objects[0]
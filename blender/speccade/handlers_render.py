@@ -23,19 +23,26 @@ from typing import Any, Dict, List, Tuple
 # Blender modules - only available when running inside Blender
 try:
     import bpy
+    import numpy as np
     from mathutils import Euler, Vector
     BLENDER_AVAILABLE = True
 except ImportError:
     BLENDER_AVAILABLE = False
 
 # Local imports from speccade package
-from .report import write_report
-from .scene import clear_scene, setup_scene, create_primitive
+from .report import outputs_by_kind, write_report
+from .scene import (
+    clear_scene,
+    setup_scene,
+    create_primitive,
+    merge_objects,
+)
 from .metrics import compute_mesh_metrics
 from .rendering import (
     create_atlas_image,
     pack_frames_into_atlas,
     setup_lighting,
+    use_eevee,
 )
 from .modifiers import apply_modifier, apply_all_modifiers
 from .materials import apply_materials
@@ -44,7 +51,7 @@ from .skeleton import create_armature, apply_skeleton_overrides, create_custom_s
 from .skeleton_presets import SKELETON_PRESETS
 from .body_parts import create_body_part, create_extrusion_part
 from .armature_driven import build_armature_driven_character_mesh
-from .handlers_mesh import create_wall_kit, create_pipe_kit, create_door_kit
+from .handlers_mesh import build_modular_kit
 
 
 # =============================================================================
@@ -243,6 +250,7 @@ def handle_mesh_to_sprite(spec: Dict, out_root: Path, report_path: Path) -> None
 
         # Join attachments (extra primitives positioned relative to base)
         attachments = mesh_params.get("attachments", [])
+        att_objs = []
         for att in attachments:
             att_prim = att.get("primitive", "cube")
             att_dims = att.get("dimensions", [1.0, 1.0, 1.0])
@@ -252,15 +260,10 @@ def handle_mesh_to_sprite(spec: Dict, out_root: Path, report_path: Path) -> None
             att_obj = create_primitive(att_prim, att_dims)
             att_obj.location = Vector(att_pos)
             att_obj.rotation_euler = Euler([math.radians(r) for r in att_rot])
-            bpy.context.view_layer.objects.active = att_obj
-            bpy.ops.object.transform_apply(location=True, rotation=True, scale=True)
+            att_objs.append(att_obj)
 
-            # Select both and join
-            bpy.ops.object.select_all(action='DESELECT')
-            att_obj.select_set(True)
-            obj.select_set(True)
-            bpy.context.view_layer.objects.active = obj
-            bpy.ops.object.join()
+        # Merge into the base mesh in one pass, baking in each attachment transform
+        merge_objects(obj, att_objs)
 
         # Apply modifiers to mesh
         export_settings = mesh_params.get("export", {})
@@ -306,7 +309,9 @@ def handle_mesh_to_sprite(spec: Dict, out_root: Path, report_path: Path) -> None
         # Set up lighting based on preset
         setup_lighting(lighting_preset, mesh_center, mesh_size)
 
-        # Configure render settings
+        # Configure render settings; flat-lit sprites need no ray tracing, so
+        # render them with EEVEE rather than leaving the engine implicit
+        use_eevee(bpy.context.scene)
         bpy.context.scene.render.resolution_x = frame_resolution[0]
         bpy.context.scene.render.resolution_y = frame_resolution[1]
         bpy.context.scene.render.film_transparent = (background_color[3] < 1.0)
@@ -333,33 +338,32 @@ def handle_mesh_to_sprite(spec: Dict, out_root: Path, report_path: Path) -> None
         frame_paths = []
         frame_metadata = []
 
-        # Calculate camera distance from mesh center
+        # Calculate camera distance from mesh center; the elevation is the
+        # same for every angle, so only its horizontal/vertical split is kept
         cam_dist = mesh_size * camera_distance
-
-        # Render each rotation angle
+        elev_rad = math.radians(camera_elevation)
+        orbit_radius = cam_dist * math.cos(elev_rad)
+        cam_z = mesh_center[2] + cam_dist * math.sin(elev_rad)
+        target = Vector(mesh_center)
+
+        # Keyframe the camera at each rotation angle (frames 1..N) so every
+        # angle renders in a single animation pass with one scene sync
+        scene = bpy.context.scene
         for i, angle in enumerate(rotation_angles):
             # Position camera around the mesh
             angle_rad = math.radians(angle)
-            elev_rad = math.radians(camera_elevation)
-
-            cam_x = mesh_center[0] + cam_dist * math.sin(angle_rad) * math.cos(elev_rad)
-            cam_y = mesh_center[1] - cam_dist * math.cos(angle_rad) * math.cos(elev_rad)
-            cam_z = mesh_center[2] + cam_dist * math.sin(elev_rad)
+            cam_x = mesh_center[0] + orbit_radius * math.sin(angle_rad)
+            cam_y = mesh_center[1] - orbit_radius * math.cos(angle_rad)
 
             camera.location = Vector((cam_x, cam_y, cam_z))
 
             # Point camera at mesh center
-            direction = Vector(mesh_center) - camera.location
+            direction = target - camera.location
             rot_quat = direction.to_track_quat('-Z', 'Y')
             camera.rotation_euler = rot_quat.to_euler()
 
-            # Render frame
-            frame_path = (temp_frames_dir / f"frame_{i:04d}.png").resolve()
-            bpy.context.scene.render.filepath = frame_path.as_posix()
-            bpy.ops.render.render(write_still=True)
-            if not frame_path.exists():
-                raise RuntimeError(f"Render output missing after render: {frame_path}")
-            frame_paths.append(frame_path)
+            camera.keyframe_insert(data_path="location", frame=i + 1)
+            camera.keyframe_insert(data_path="rotation_euler", frame=i + 1)
 
             frame_metadata.append({
                 "id": f"angle_{int(angle)}",
@@ -367,6 +371,21 @@ def handle_mesh_to_sprite(spec: Dict, out_root: Path, report_path: Path) -> None
                 "index": i
             })
 
+        # Render all frames; Blender appends the zero-padded frame number
+        if rotation_angles:
+            scene.frame_start = 1
+            scene.frame_end = len(rotation_angles)
+            scene.frame_step = 1
+            scene.render.use_file_extension = True
+            scene.render.filepath = (temp_frames_dir / "frame_").resolve().as_posix()
+            bpy.ops.render.render(animation=True)
+
+        for i in range(len(rotation_angles)):
+            frame_path = (temp_frames_dir / f"frame_{i + 1:04d}.png").resolve()
+            if not frame_path.exists():
+                raise RuntimeError(f"Render output missing after render: {frame_path}")
+            frame_paths.append(frame_path)
+
         # Pack frames into atlas
         atlas_width, atlas_height, frame_positions = pack_frames_into_atlas(
             frame_paths,
@@ -384,9 +403,9 @@ def handle_mesh_to_sprite(spec: Dict, out_root: Path, report_path: Path) -> None
         )
 
         # Get output paths from spec
-        outputs = spec.get("outputs", [])
-        primary_output = next((o for o in outputs if o.get("kind") == "primary"), None)
-        metadata_output = next((o for o in outputs if o.get("kind") == "metadata"), None)
+        outputs = outputs_by_kind(spec)
+        primary_output = outputs.get("primary")
+        metadata_output = outputs.get("metadata")
 
         if not primary_output:
             raise ValueError("No primary output specified in spec")
@@ -432,10 +451,7 @@ def handle_mesh_to_sprite(spec: Dict, out_root: Path, report_path: Path) -> None
             with open(metadata_path, 'w') as f:
                 json.dump(metadata, f, indent=2)
 
-        # Clean up temp frames
-        for frame_path in frame_paths:
-            if frame_path.exists():
-                frame_path.unlink()
+        # Clean up temp frames (one tree removal covers every frame file)
         shutil.rmtree(temp_frames_dir, ignore_errors=True)
 
         # Build metrics
@@ -450,9 +466,9 @@ def handle_mesh_to_sprite(spec: Dict, out_root: Path, report_path: Path) -> None
         # Save .blend file if requested
         blend_rel_path = None
         if params.get("save_blend", False):
-            blend_rel_path = output_rel_path.replace(".png", ".blend")
+            blend_rel_path = Path(output_rel_path).with_suffix(".blend").as_posix()
             blend_path = out_root / blend_rel_path
-            bpy.ops.wm.save_as_mainfile(filepath=str(blend_path))
+            bpy.ops.wm.save_as_mainfile(filepath=str(blend_path), compress=True, copy=True)
 
         duration_ms = int((time.time() - start_time) * 1000)
         write_report(report_path, ok=True, metrics=metrics,
@@ -475,10 +491,11 @@ def get_mesh_bounds(obj: 'bpy.types.Object') -> Tuple[List[float], List[float]]:
         A tuple of (min_corner, max_corner) where each is a list of [x, y, z]
         coordinates in world space.
     """
-    bbox_corners = [obj.matrix_world @ Vector(corner) for corner in obj.bound_box]
-    min_corner = [min(c[i] for c in bbox_corners) for i in range(3)]
-    max_corner = [max(c[i] for c in bbox_corners) for i in range(3)]
-    return min_corner, max_corner
+    # Transform all 8 local bound_box corners in one matrix product
+    corners = np.array(obj.bound_box, dtype=np.float64)
+    matrix = np.array(obj.matrix_world, dtype=np.float64)
+    world = corners @ matrix[:3, :3].T + matrix[:3, 3]
+    return world.min(axis=0).tolist(), world.max(axis=0).tolist()
 
 
 # =============================================================================
@@ -583,16 +600,7 @@ def handle_validation_grid(
         elif recipe_kind == "static_mesh.modular_kit_v1":
             # Modular kit - walls, pipes, doors
             kit_type_spec = params.get("kit_type", {})
-            kit_type = kit_type_spec.get("type", "wall")
-
-            if kit_type == "wall":
-                obj = create_wall_kit(kit_type_spec)
-            elif kit_type == "pipe":
-                obj = create_pipe_kit(kit_type_spec)
-            elif kit_type == "door":
-                obj = create_door_kit(kit_type_spec)
-            else:
-                raise ValueError(f"Unknown modular kit type: {kit_type}")
+            obj = build_modular_kit(kit_type_spec)
 
             # Apply export settings
             export_settings = params.get("export", {})
@@ -611,6 +619,7 @@ def handle_validation_grid(
 
             # Join attachments (extra primitives positioned relative to base)
             attachments = params.get("attachments", [])
+            att_objs = []
             for att in attachments:
                 att_prim = att.get("primitive", "cube")
                 att_dims = att.get("dimensions", [1.0, 1.0, 1.0])
@@ -620,15 +629,10 @@ def handle_validation_grid(
                 att_obj = create_primitive(att_prim, att_dims)
                 att_obj.location = Vector(att_pos)
                 att_obj.rotation_euler = Euler([math.radians(r) for r in att_rot])
-                bpy.context.view_layer.objects.active = att_obj
-                bpy.ops.object.transform_apply(location=True, rotation=True, scale=True)
+                att_objs.append(att_obj)
 
-                # Select both and join
-                bpy.ops.object.select_all(action='DESELECT')
-                att_obj.select_set(True)
-                obj.select_set(True)
-                bpy.context.view_layer.objects.active = obj
-                bpy.ops.object.join()
+            # Merge into the base mesh in one pass, baking in each attachment transform
+            merge_objects(obj, att_objs)
 
             # Apply modifiers to mesh
             export_settings = params.get("export", {})
@@ -672,7 +676,8 @@ def handle_validation_grid(
                         candidates.append(p.with_suffix('.gltf'))
                     mesh_path = next((c for c in candidates if c.exists()), None)
                     if mesh_path is not None:
-                        bpy.ops.object.select_all(action='DESELECT')
+                        for selected in bpy.context.selected_objects:
+                            selected.select_set(False)
                         bpy.ops.import_scene.gltf(filepath=str(mesh_path))
                         imported_meshes = [o for o in bpy.context.selected_objects if o.type == 'MESH']
                         if imported_meshes:
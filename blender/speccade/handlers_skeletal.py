@@ -44,10 +44,13 @@ from .metrics import compute_skeletal_mesh_metrics, compute_animation_metrics
 from .export import export_glb
 from .rendering import render_animation_preview_frames
 from .materials import apply_materials
+from .modifiers import triangulate_mesh
 
 
 def _select_only(objs: List['bpy.types.Object'], *, active: Optional['bpy.types.Object'] = None) -> None:
-    bpy.ops.object.select_all(action='DESELECT')
+    # Deselect directly; only currently selected objects need touching
+    for selected in bpy.context.selected_objects:
+        selected.select_set(False)
     for obj in objs:
         obj.select_set(True)
     if active is not None:
@@ -115,18 +118,6 @@ def _remove_uv_layers(mesh_obj: 'bpy.types.Object') -> None:
         pass
 
 
-def _apply_triangulate_modifier(mesh_obj: 'bpy.types.Object') -> None:
-    """Triangulate the mesh by applying a TRIANGULATE modifier (best effort)."""
-    _ensure_object_mode()
-    _select_only([mesh_obj], active=mesh_obj)
-    try:
-        mod = mesh_obj.modifiers.new(name='SC_Triangulate', type='TRIANGULATE')
-        bpy.ops.object.modifier_apply(modifier=mod.name)
-    except Exception:
-        # If apply fails (e.g. no active object in bg mode), keep going.
-        pass
-
-
 def _assign_all_vertices_to_group(mesh_obj: 'bpy.types.Object', group_name: str, *, weight: float = 1.0) -> None:
     vg = mesh_obj.vertex_groups.get(group_name)
     if vg is None:
@@ -434,7 +425,7 @@ def handle_skeletal_mesh(spec: Dict, out_root: Path, report_path: Path) -> None:
         if not include_uvs:
             _remove_uv_layers(combined_mesh)
         if triangulate:
-            _apply_triangulate_modifier(combined_mesh)
+            triangulate_mesh(combined_mesh)
 
         # Compute metrics
         metrics = compute_skeletal_mesh_metrics(combined_mesh, armature)
@@ -443,7 +434,7 @@ def handle_skeletal_mesh(spec: Dict, out_root: Path, report_path: Path) -> None:
         tri_budget = params.get("tri_budget")
         if tri_budget:
             metrics["tri_budget"] = tri_budget
-            metrics["tri_budget_exceeded"] = metrics.get("triangle_count", 0) > tri_budget
+            metrics["tri_budget_exceeded"] = metrics["triangle_count"] > tri_budget
 
         # Export GLB
         export_glb(
@@ -460,9 +451,9 @@ def handle_skeletal_mesh(spec: Dict, out_root: Path, report_path: Path) -> None:
         # Save .blend file if requested
         blend_rel_path = None
         if export_settings.get("save_blend", False):
-            blend_rel_path = output_rel_path.replace(".glb", ".blend")
+            blend_rel_path = Path(output_rel_path).with_suffix(".blend").as_posix()
             blend_path = out_root / blend_rel_path
-            bpy.ops.wm.save_as_mainfile(filepath=str(blend_path))
+            bpy.ops.wm.save_as_mainfile(filepath=str(blend_path), compress=True, copy=True)
 
         duration_ms = int((time.time() - start_time) * 1000)
         write_report(
@@ -544,9 +535,9 @@ def handle_animation(spec: Dict, out_root: Path, report_path: Path) -> None:
         blend_rel_path = None
         export_settings = params.get("export", {})
         if export_settings.get("save_blend", False):
-            blend_rel_path = output_rel_path.replace(".glb", ".blend")
+            blend_rel_path = Path(output_rel_path).with_suffix(".blend").as_posix()
             blend_path = out_root / blend_rel_path
-            bpy.ops.wm.save_as_mainfile(filepath=str(blend_path))
+            bpy.ops.wm.save_as_mainfile(filepath=str(blend_path), compress=True, copy=True)
 
         duration_ms = int((time.time() - start_time) * 1000)
         write_report(report_path, ok=True, metrics=metrics,
@@ -834,7 +825,7 @@ def handle_rigged_animation(spec: Dict, out_root: Path, report_path: Path) -> No
             # not the visual pose (which is rest pose in Blender 5.0 background mode)
             bpy.context.view_layer.objects.active = armature
             bpy.ops.object.mode_set(mode='POSE')
-            bpy.ops.pose.select_all(action='SELECT')
+            # only_selected=False bakes every bone, so no select-all pass
             bpy.ops.nla.bake(
                 frame_start=1,
                 frame_end=frame_count,
@@ -893,9 +884,9 @@ def handle_rigged_animation(spec: Dict, out_root: Path, report_path: Path) -> No
         blend_rel_path = None
         save_blend = params.get("save_blend", False) or export_settings.get("save_blend", False)
         if save_blend:
-            blend_rel_path = output_rel_path.replace(".glb", ".blend")
+            blend_rel_path = Path(output_rel_path).with_suffix(".blend").as_posix()
             blend_path = out_root / blend_rel_path
-            bpy.ops.wm.save_as_mainfile(filepath=str(blend_path))
+            bpy.ops.wm.save_as_mainfile(filepath=str(blend_path), compress=True, copy=True)
 
         # Preview was rendered before baking - just add metrics if available
         # (preview_rel_dir is already set from earlier)
@@ -979,9 +970,9 @@ def handle_animation_helpers(spec: Dict, out_root: Path, report_path: Path) -> N
         # Save .blend file if requested
         blend_rel_path = None
         if params.get("save_blend", False):
-            blend_rel_path = output_rel_path.replace(".glb", ".blend")
+            blend_rel_path = Path(output_rel_path).with_suffix(".blend").as_posix()
             blend_path = out_root / blend_rel_path
-            bpy.ops.wm.save_as_mainfile(filepath=str(blend_path))
+            bpy.ops.wm.save_as_mainfile(filepath=str(blend_path), compress=True, copy=True)
 
         duration_ms = int((time.time() - start_time) * 1000)
         write_report(report_path, ok=True, metrics=metrics,
@@ -0,0 +1,64 @@
+"""
+SpecCade Image I/O Module
+
+This module writes 8-bit RGBA PNG files using only the standard library.
+Unlike Blender's image save API it never touches bpy, so encoding can run on
+a worker thread (zlib releases the GIL) while Blender keeps baking or
+rendering on the main thread.
+"""
+
+import struct
+import zlib
+from pathlib import Path
+
+
+# zlib level used for PNG IDAT data; fixed so output bytes are reproducible.
+PNG_COMPRESSION_LEVEL = 6
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def _png_chunk(chunk_type: bytes, data: bytes) -> bytes:
+    """Build a single length/type/data/CRC PNG chunk."""
+    crc = zlib.crc32(chunk_type + data) & 0xFFFFFFFF
+    return struct.pack(">I", len(data)) + chunk_type + data + struct.pack(">I", crc)
+
+
+def encode_png_rgba8(rgba: bytes, width: int, height: int) -> bytes:
+    """
+    Encode top-down 8-bit RGBA pixel data as a PNG file.
+
+    Args:
+        rgba: width * height * 4 bytes, rows ordered top to bottom.
+        width: Image width in pixels.
+        height: Image height in pixels.
+
+    Returns:
+        The complete PNG file contents.
+    """
+    stride = width * 4
+    if len(rgba) != stride * height:
+        raise ValueError(
+            f"Expected {stride * height} bytes of RGBA data, got {len(rgba)}"
+        )
+
+    # Each scanline is prefixed with filter type 0 (None).
+    raw = bytearray()
+    view = memoryview(rgba)
+    for row in range(height):
+        raw.append(0)
+        raw += view[row * stride:(row + 1) * stride]
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)
+    return b"".join((
+        _PNG_SIGNATURE,
+        _png_chunk(b"IHDR", header),
+        _png_chunk(b"IDAT", zlib.compress(bytes(raw), PNG_COMPRESSION_LEVEL)),
+        _png_chunk(b"IEND", b""),
+    ))
+
+
+def write_png_rgba8(path: Path, rgba: bytes, width: int, height: int) -> None:
+    """Encode top-down 8-bit RGBA pixel data and write it to path as PNG."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(encode_png_rgba8(rgba, width, height))
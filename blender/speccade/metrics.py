@@ -20,6 +20,7 @@ from typing import Any, Dict, List, Optional, Tuple
 try:
     import bpy
     import bmesh
+    import numpy as np
     from mathutils import Euler, Matrix, Vector
     BLENDER_AVAILABLE = True
 except ImportError:
@@ -47,18 +48,10 @@ def compute_mesh_metrics(obj: 'bpy.types.Object') -> Dict[str, Any]:
     face_count = len(mesh.polygons)
     edge_count = len(mesh.edges)
 
-    # Count triangles and quads
-    triangle_count = 0
-    quad_count = 0
-    for poly in mesh.polygons:
-        vert_count = len(poly.vertices)
-        if vert_count == 3:
-            triangle_count += 1
-        elif vert_count == 4:
-            quad_count += 1
-            triangle_count += 2  # A quad is 2 triangles
-        else:
-            triangle_count += vert_count - 2  # N-gon triangulation
+    # Count triangles and quads (an N-gon triangulates into N - 2 triangles)
+    loop_totals = _polygon_loop_totals(mesh)
+    triangle_count = int(loop_totals.sum()) - 2 * face_count
+    quad_count = int(np.count_nonzero(loop_totals == 4))
 
     quad_percentage = (quad_count / face_count * 100.0) if face_count > 0 else 0.0
 
@@ -68,14 +61,16 @@ def compute_mesh_metrics(obj: 'bpy.types.Object') -> Dict[str, Any]:
     degenerate_faces = count_degenerate_faces(mesh)
     zero_area_faces = count_zero_area_faces(mesh)
 
-    # Bounding box
+    # Bounding box of the world-space vertex positions
     bbox_min = [float('inf')] * 3
     bbox_max = [float('-inf')] * 3
-    for v in mesh.vertices:
-        co = obj.matrix_world @ v.co
-        for i in range(3):
-            bbox_min[i] = min(bbox_min[i], co[i])
-            bbox_max[i] = max(bbox_max[i], co[i])
+    if vertex_count > 0:
+        coords = np.empty(vertex_count * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", coords)
+        matrix = np.array(obj.matrix_world, dtype=np.float64)
+        world = coords.reshape(-1, 3) @ matrix[:3, :3].T + matrix[:3, 3]
+        bbox_min = world.min(axis=0).tolist()
+        bbox_max = world.max(axis=0).tolist()
 
     # UV metrics
     uv_island_count = 0
@@ -134,45 +129,86 @@ def compute_mesh_metrics(obj: 'bpy.types.Object') -> Dict[str, Any]:
     return result
 
 
+def _polygon_loop_totals(mesh: 'bpy.types.Mesh') -> 'np.ndarray':
+    """Read every polygon's corner count in one bulk copy."""
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    return loop_totals
+
+
+def _polygon_areas(mesh: 'bpy.types.Mesh') -> 'np.ndarray':
+    """Read every polygon's area in one bulk copy."""
+    areas = np.empty(len(mesh.polygons), dtype=np.float32)
+    mesh.polygons.foreach_get("area", areas)
+    return areas
+
+
+def _uv_fan_area(mesh: 'bpy.types.Mesh', uv_layer: 'bpy.types.MeshUVLoopLayer') -> Tuple[int, float]:
+    """
+    Sum the UV-space area of every polygon, fan-triangulated from its first corner.
+
+    Returns:
+        Tuple of (triangle count, total absolute UV area).
+    """
+    loop_count = len(mesh.loops)
+    if loop_count == 0:
+        return 0, 0.0
+
+    uvs = np.empty(loop_count * 2, dtype=np.float32)
+    uv_layer.data.foreach_get("uv", uvs)
+    uvs = uvs.reshape(-1, 2).astype(np.float64)
+
+    loop_starts = np.empty(len(mesh.polygons), dtype=np.int64)
+    mesh.polygons.foreach_get("loop_start", loop_starts)
+    loop_totals = _polygon_loop_totals(mesh)
+
+    # Triangle (first, j, j + 1) for every corner j from 1 to loop_total - 2
+    fan_counts = np.maximum(loop_totals - 2, 0)
+    firsts = np.repeat(loop_starts, fan_counts)
+    offsets = np.arange(len(firsts)) - np.repeat(np.cumsum(fan_counts) - fan_counts, fan_counts)
+    seconds = firsts + 1 + offsets
+
+    edge_a = uvs[seconds] - uvs[firsts]
+    edge_b = uvs[seconds + 1] - uvs[firsts]
+    areas = 0.5 * np.abs(edge_a[:, 0] * edge_b[:, 1] - edge_b[:, 0] * edge_a[:, 1])
+    return len(firsts), float(areas.sum())
+
+
 def count_non_manifold_edges(mesh: 'bpy.types.Mesh') -> int:
     """Count non-manifold edges (edges with != 2 adjacent faces)."""
-    edge_face_count = {}
-    for poly in mesh.polygons:
-        for i in range(len(poly.vertices)):
-            v1 = poly.vertices[i]
-            v2 = poly.vertices[(i + 1) % len(poly.vertices)]
-            edge_key = (min(v1, v2), max(v1, v2))
-            edge_face_count[edge_key] = edge_face_count.get(edge_key, 0) + 1
-
-    non_manifold = 0
-    for count in edge_face_count.values():
-        if count != 2:
-            non_manifold += 1
-    return non_manifold
+    if not mesh.loops:
+        return 0
+    edge_indices = np.empty(len(mesh.loops), dtype=np.int64)
+    mesh.loops.foreach_get("edge_index", edge_indices)
+    # Each face corner references one face edge; loose edges are not counted
+    edge_face_count = np.bincount(edge_indices)
+    return int(np.count_nonzero((edge_face_count > 0) & (edge_face_count != 2)))
 
 
 def count_degenerate_faces(mesh: 'bpy.types.Mesh') -> int:
     """Count degenerate faces (zero area or invalid topology)."""
-    degenerate = 0
-    for poly in mesh.polygons:
-        # Check for zero area
-        if poly.area < 1e-8:
-            degenerate += 1
-            continue
-        # Check for duplicate vertices
-        verts = list(poly.vertices)
-        if len(verts) != len(set(verts)):
-            degenerate += 1
-    return degenerate
+    face_count = len(mesh.polygons)
+    if face_count == 0:
+        return 0
+
+    # Check for zero area
+    degenerate = _polygon_areas(mesh) < 1e-8
+
+    # Check for duplicate vertices: sorting (face, vertex) keys puts repeats
+    # of a vertex within one face next to each other.
+    vertex_indices = np.empty(len(mesh.loops), dtype=np.int64)
+    mesh.loops.foreach_get("vertex_index", vertex_indices)
+    loop_faces = np.repeat(np.arange(face_count, dtype=np.int64), _polygon_loop_totals(mesh))
+    keys = np.sort(loop_faces * len(mesh.vertices) + vertex_indices)
+    repeated = keys[1:] == keys[:-1]
+    degenerate[keys[1:][repeated] // max(len(mesh.vertices), 1)] = True
+
+    return int(np.count_nonzero(degenerate))
 
 
 def count_zero_area_faces(mesh: 'bpy.types.Mesh') -> int:
     """Count faces with zero or near-zero area (CHAR-003)."""
-    zero_area = 0
-    for poly in mesh.polygons:
-        if poly.area < 1e-8:
-            zero_area += 1
-    return zero_area
+    return int(np.count_nonzero(_polygon_areas(mesh) < 1e-8))
 
 
 def compute_uv_coverage_and_overlap(
@@ -180,24 +216,11 @@ def compute_uv_coverage_and_overlap(
     uv_layer: 'bpy.types.MeshUVLoopLayer'
 ) -> Tuple[float, float]:
     """Compute UV coverage (0-1) and overlap percentage (0-100)."""
-    # Collect all UV triangles
-    uv_triangles = []
-    for poly in mesh.polygons:
-        loop_indices = list(poly.loop_indices)
-        uvs = [tuple(uv_layer.data[li].uv) for li in loop_indices]
-        # Triangulate the polygon
-        for i in range(1, len(uvs) - 1):
-            uv_triangles.append((uvs[0], uvs[i], uvs[i + 1]))
-
-    if not uv_triangles:
+    # Total UV area of all fan triangles (may include overlaps)
+    triangle_count, total_area = _uv_fan_area(mesh, uv_layer)
+    if triangle_count == 0:
         return 0.0, 0.0
 
-    # Compute total UV area (may include overlaps)
-    total_area = 0.0
-    for tri in uv_triangles:
-        area = triangle_area_2d(tri[0], tri[1], tri[2])
-        total_area += abs(area)
-
     # Simple coverage estimate: clamp to [0, 1]
     # UV space is [0,1] x [0,1] = 1.0 area
     coverage = min(total_area, 1.0)
@@ -271,29 +294,9 @@ def compute_texel_density_from_mesh(
     Returns:
         Average texel density in pixels per world unit.
     """
-    uv_data = uv_layer.data
-
-    total_uv_area = 0.0
-    total_world_area = 0.0
-
-    for poly in mesh.polygons:
-        # Get UV coordinates for this face
-        uvs = [uv_data[loop_idx].uv for loop_idx in poly.loop_indices]
-
-        # Compute UV space area (triangulate the polygon)
-        uv_area = 0.0
-        for i in range(1, len(uvs) - 1):
-            uv_area += abs(triangle_area_2d(
-                (uvs[0].x, uvs[0].y),
-                (uvs[i].x, uvs[i].y),
-                (uvs[i + 1].x, uvs[i + 1].y)
-            ))
-
-        # Compute world space area
-        world_area = poly.area
-
-        total_uv_area += uv_area
-        total_world_area += world_area
+    # Compute UV space area (triangulating each polygon) and world space area
+    _, total_uv_area = _uv_fan_area(mesh, uv_layer)
+    total_world_area = float(_polygon_areas(mesh).sum(dtype=np.float64))
 
     if total_world_area < 1e-8:
         return 0.0
@@ -321,26 +324,26 @@ def compute_skeletal_mesh_metrics(obj: 'bpy.types.Object', armature: 'bpy.types.
     normalized_vertex_count = 0
     max_weight_deviation = 0.0
 
-    if obj.vertex_groups:
-        for v in obj.data.vertices:
-            # Count influences per vertex (weight > 0.001 threshold)
-            influences = sum(1 for g in v.groups if g.weight > 0.001)
-            max_influences = max(max_influences, influences)
+    if obj.vertex_groups and len(obj.data.vertices) > 0:
+        owners, weights = _vertex_group_weights(obj.data)
+        vertex_count = len(obj.data.vertices)
+
+        # Count influences per vertex (weight > 0.001 threshold)
+        influences = np.bincount(owners[weights > 0.001], minlength=vertex_count)
+        max_influences = int(influences.max())
 
-            # Compute weight sum for this vertex
-            weight_sum = sum(g.weight for g in v.groups)
+        # Per-vertex weight sums, accumulated in group order
+        weight_sums = np.bincount(owners, weights=weights, minlength=vertex_count)
 
-            # Track unweighted vertices (total weight < 0.001)
-            if weight_sum < 0.001:
-                unweighted_vertex_count += 1
-            else:
-                # Track deviation from normalized (1.0)
-                deviation = abs(weight_sum - 1.0)
-                max_weight_deviation = max(max_weight_deviation, deviation)
+        # Track unweighted vertices (total weight < 0.001)
+        weighted = weight_sums >= 0.001
+        unweighted_vertex_count = int(vertex_count - np.count_nonzero(weighted))
 
-                # Consider normalized if within 0.001 of 1.0
-                if deviation < 0.001:
-                    normalized_vertex_count += 1
+        # Track deviation from normalized (1.0); normalized if within 0.001
+        deviations = np.abs(weight_sums[weighted] - 1.0)
+        if deviations.size:
+            max_weight_deviation = float(deviations.max())
+        normalized_vertex_count = int(np.count_nonzero(deviations < 0.001))
 
     # Compute weight normalization percentage
     total_vertices = len(obj.data.vertices)
@@ -363,6 +366,21 @@ def compute_skeletal_mesh_metrics(obj: 'bpy.types.Object', armature: 'bpy.types.
     return mesh_metrics
 
 
+def _vertex_group_weights(mesh: 'bpy.types.Mesh') -> Tuple['np.ndarray', 'np.ndarray']:
+    """Flatten every vertex's group weights into (owner vertex, weight) arrays.
+
+    Vertex groups have no foreach_get, so this is the one Python pass over
+    the vertices; everything downstream is array math.
+    """
+    vertices = mesh.vertices
+    counts = np.fromiter((len(v.groups) for v in vertices), dtype=np.int64, count=len(vertices))
+    weights = np.fromiter(
+        (g.weight for v in vertices for g in v.groups), dtype=np.float64, count=int(counts.sum())
+    )
+    owners = np.repeat(np.arange(len(vertices)), counts)
+    return owners, weights
+
+
 def _wrap_degrees(angle_deg: float) -> float:
     """Wrap an angle to [-180, 180] degrees."""
     while angle_deg > 180.0:
@@ -11,8 +11,12 @@ from typing import Dict
 
 try:
     import bpy
+    import bmesh
+    import numpy as np
 except ImportError:
     bpy = None  # type: ignore
+    bmesh = None  # type: ignore
+    np = None  # type: ignore
 
 
 def apply_modifier(obj: 'bpy.types.Object', modifier_spec: Dict) -> None:
@@ -81,11 +85,67 @@ def apply_modifier(obj: 'bpy.types.Object', modifier_spec: Dict) -> None:
         print(f"Warning: Unknown modifier type: {mod_type}")
 
 
-def apply_all_modifiers(obj: 'bpy.types.Object') -> None:
-    """Apply all modifiers to an object."""
-    bpy.context.view_layer.objects.active = obj
-    for mod in obj.modifiers:
-        try:
-            bpy.ops.object.modifier_apply(modifier=mod.name)
-        except RuntimeError as e:
-            print(f"Warning: Could not apply modifier {mod.name}: {e}")
+def apply_all_modifiers(obj: 'bpy.types.Object', triangulate: bool = False) -> None:
+    """
+    Apply all modifiers to an object.
+
+    The whole stack is evaluated with a single depsgraph pass and the result
+    replaces the object's mesh data, instead of one operator call (and one
+    depsgraph update) per modifier. With triangulate=True the evaluated mesh
+    is triangulated before it is swapped in, without a second evaluation.
+    """
+    if not obj.modifiers:
+        if triangulate:
+            triangulate_mesh(obj)
+        return
+
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    obj_eval = obj.evaluated_get(depsgraph)
+    try:
+        mesh = bpy.data.meshes.new_from_object(
+            obj_eval, preserve_all_data_layers=True, depsgraph=depsgraph
+        )
+    except RuntimeError as e:
+        print(f"Warning: Could not apply modifiers on {obj.name}: {e}")
+        return
+
+    if triangulate:
+        bm = bmesh.new()
+        bm.from_mesh(mesh)
+        triangulate_bmesh(bm)
+        bm.to_mesh(mesh)
+        bm.free()
+
+    old_mesh = obj.data
+    obj.modifiers.clear()
+    obj.data = mesh
+    if old_mesh.users == 0:
+        name = old_mesh.name
+        bpy.data.meshes.remove(old_mesh)
+        mesh.name = name
+
+
+def triangulate_mesh(obj: 'bpy.types.Object') -> None:
+    """
+    Triangulate an object's mesh data in place.
+
+    Matches applying a Triangulate modifier with default settings (shortest
+    diagonal for quads, beauty for n-gons) without the modifier round trip.
+    Meshes that are already all triangles are left untouched.
+    """
+    mesh = obj.data
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    if not np.any(loop_totals > 3):
+        return
+
+    bm = bmesh.new()
+    bm.from_mesh(mesh)
+    triangulate_bmesh(bm)
+    bm.to_mesh(mesh)
+    bm.free()
+
+
+def triangulate_bmesh(bm: 'bmesh.types.BMesh') -> None:
+    """Triangulate every face of bm with the Triangulate modifier defaults."""
+    bmesh.ops.triangulate(bm, faces=bm.faces[:], quad_method='SHORT_EDGE', ngon_method='BEAUTY')
@@ -24,11 +24,15 @@ from typing import Any, Dict, List, Optional, Tuple
 try:
     import bpy
     import bmesh
+    import numpy as np
     from mathutils import Euler, Vector
     BLENDER_AVAILABLE = True
 except ImportError:
     BLENDER_AVAILABLE = False
 
+# Import from sibling modules
+from .image_io import write_png_rgba8
+
 
 def _iter_action_fcurves(action: Any):
     """
@@ -265,6 +269,23 @@ def create_stick_figure_for_frame(armature: 'bpy.types.Object', mat: 'bpy.types.
     return obj
 
 
+# Anti-aliasing samples for EEVEE renders of previews and sprites
+EEVEE_RENDER_SAMPLES = 16
+
+
+def use_eevee(scene: 'bpy.types.Scene', samples: int = EEVEE_RENDER_SAMPLES) -> None:
+    """Render scene with EEVEE (EEVEE Next where available) at a low sample count."""
+    if hasattr(scene.render, 'engine'):
+        if 'BLENDER_EEVEE_NEXT' in dir(bpy.types):
+            scene.render.engine = 'BLENDER_EEVEE_NEXT'
+        else:
+            scene.render.engine = 'BLENDER_EEVEE'
+
+    # Low samples for speed
+    if hasattr(scene, 'eevee'):
+        scene.eevee.taa_render_samples = samples
+
+
 def render_animation_preview_frames(
     armature: 'bpy.types.Object',
     output_dir: Path,
@@ -330,15 +351,7 @@ def render_animation_preview_frames(
     scene.world = world
 
     # Configure render engine for fast preview
-    if hasattr(scene.render, 'engine'):
-        if 'BLENDER_EEVEE_NEXT' in dir(bpy.types):
-            scene.render.engine = 'BLENDER_EEVEE_NEXT'
-        else:
-            scene.render.engine = 'BLENDER_EEVEE'
-
-    # Low samples for speed
-    if hasattr(scene, 'eevee'):
-        scene.eevee.taa_render_samples = 16
+    use_eevee(scene)
 
     # Set output format to PNG
     scene.render.image_settings.file_format = 'PNG'
@@ -616,14 +629,21 @@ def pack_frames_into_atlas(
     return atlas_width, atlas_height, positions
 
 
-class _BlenderAtlasImage:
-    """Wraps a bpy.types.Image to provide a .save(path) interface for atlas compositing."""
+class _RGBA8AtlasImage:
+    """Holds a composited 8-bit RGBA atlas and provides a .save(path) interface."""
 
-    def __init__(self, bpy_image: 'bpy.types.Image'):
-        self._img = bpy_image
+    def __init__(self, pixels: 'np.ndarray'):
+        # (height, width, 4) uint8, rows bottom-up like Blender images
+        self._pixels = pixels
 
     def save(self, path: str) -> None:
-        save_image_png(self._img, Path(path))
+        height, width = self._pixels.shape[:2]
+        write_png_rgba8(Path(path), self._pixels[::-1].tobytes(), width, height)
+
+
+def _float_to_rgba8(pixels: 'np.ndarray') -> 'np.ndarray':
+    """Convert float pixels to bytes the way Blender does (clamp, round half up)."""
+    return (np.clip(pixels, 0.0, 1.0) * 255.0 + 0.5).astype(np.uint8)
 
 
 def copy_image_pixels(source: 'bpy.types.Image', name: str) -> 'bpy.types.Image':
@@ -652,34 +672,33 @@ def create_atlas_image(
     atlas_width: int,
     atlas_height: int,
     background_color: List[float]
-) -> '_BlenderAtlasImage':
+) -> '_RGBA8AtlasImage':
     """
-    Create the atlas image by compositing individual frames using Blender's image API.
+    Create the atlas image by compositing individual frames into one 8-bit buffer.
+
+    Frames are loaded with Blender's image API; the atlas itself never
+    becomes a Blender image and is written with the standard-library encoder.
 
     Returns:
-        _BlenderAtlasImage with a .save(path) method
+        _RGBA8AtlasImage with a .save(path) method
     """
-    # Create atlas image filled with background color
-    atlas = bpy.data.images.new("speccade_atlas", width=atlas_width, height=atlas_height, alpha=True)
+    # Preallocate the atlas filled with the background color
     bg = list(background_color[:4]) if len(background_color) >= 4 else list(background_color[:3]) + [1.0]
-    pixels = bg * (atlas_width * atlas_height)
-    atlas.pixels[:] = pixels
+    atlas_pixels = np.empty((atlas_height, atlas_width, 4), dtype=np.uint8)
+    atlas_pixels[:] = _float_to_rgba8(np.array(bg, dtype=np.float32))
 
     # Load and paste each frame
     for frame_path, (x, y) in zip(frame_paths, positions):
         frame = bpy.data.images.load(str(frame_path))
         fw, fh = frame.size[0], frame.size[1]
-        frame_pixels = list(frame.pixels[:])
+        frame_pixels = np.empty(fw * fh * 4, dtype=np.float32)
+        frame.pixels.foreach_get(frame_pixels)
 
-        atlas_pixels = list(atlas.pixels[:])
-        for row in range(fh):
-            # bpy images are bottom-up; position (x, y) is top-left in screen coords
-            atlas_row = (atlas_height - 1 - y - row)
-            src_start = row * fw * 4
-            dst_start = (atlas_row * atlas_width + x) * 4
-            atlas_pixels[dst_start:dst_start + fw * 4] = frame_pixels[src_start:src_start + fw * 4]
-        atlas.pixels[:] = atlas_pixels
+        # bpy images are bottom-up; position (x, y) is top-left in screen
+        # coords, and frame row r lands on atlas row (height - 1 - y - r)
+        top = atlas_height - y - fh
+        atlas_pixels[top:top + fh, x:x + fw] = _float_to_rgba8(frame_pixels).reshape(fh, fw, 4)[::-1]
 
         bpy.data.images.remove(frame)
 
-    return _BlenderAtlasImage(atlas)
+    return _RGBA8AtlasImage(atlas_pixels)
@@ -3,11 +3,13 @@ SpecCade Report Generation Module
 
 This module handles writing generation reports for Blender asset creation.
 Reports include success/failure status, metrics, output paths, and timing.
+It also looks up the spec outputs that handlers report on.
 """
 
 import json
+import math
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 
 # Blender modules - only available when running inside Blender
 try:
@@ -16,6 +18,46 @@ try:
 except ImportError:
     BLENDER_AVAILABLE = False
 
+# orjson is optional; it serializes large metrics dicts (and numpy values)
+# much faster than the stdlib encoder.
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+
+def _finite_or_null(value: Any) -> Any:
+    """Replace NaN and infinite floats with None, as orjson writes them as null."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _finite_or_null(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite_or_null(item) for item in value]
+    return value
+
+
+def _dumps(report: Dict) -> bytes:
+    """Serialize a report as indented JSON bytes.
+
+    Both encoders write non-finite floats as null and keep non-ASCII text as
+    raw UTF-8, so the report does not depend on whether orjson is installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            report,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(_finite_or_null(report), indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def outputs_by_kind(spec: Dict) -> Dict[str, Dict]:
+    """Index a spec's outputs by kind; the first output of each kind wins."""
+    by_kind: Dict[str, Dict] = {}
+    for output in spec.get("outputs", []):
+        by_kind.setdefault(output.get("kind"), output)
+    return by_kind
+
 
 def write_report(report_path: Path, ok: bool, error: Optional[str] = None,
                  metrics: Optional[Dict] = None, output_path: Optional[str] = None,
@@ -40,5 +82,4 @@ def write_report(report_path: Path, ok: bool, error: Optional[str] = None,
     if BLENDER_AVAILABLE:
         report["blender_version"] = bpy.app.version_string
 
-    with open(report_path, 'w') as f:
-        json.dump(report, f, indent=2)
+    Path(report_path).write_bytes(_dumps(report))
@@ -5,11 +5,13 @@ This module handles Blender scene initialization and primitive mesh creation.
 It provides functions to clear the scene and create basic mesh primitives.
 """
 
-from typing import List
+from typing import Dict, List
 
 # Blender modules - only available when running inside Blender
 try:
     import bpy
+    import bmesh
+    from mathutils import Matrix
     BLENDER_AVAILABLE = True
 except ImportError:
     BLENDER_AVAILABLE = False
@@ -39,6 +41,37 @@ PRIMITIVE_CREATORS = {
 }
 
 
+# Prefix for cached primitive template meshes (one per primitive type)
+PRIMITIVE_TEMPLATE_PREFIX = "SpecCadePrimitive_"
+
+# Object name the primitive operator gives each primitive type, recorded
+# when its template is built
+_PRIMITIVE_OBJECT_NAMES: Dict[str, str] = {}
+
+
+def _primitive_template(primitive_type: str) -> 'bpy.types.Mesh':
+    """
+    Get the cached unit mesh for a primitive type, building it on first use.
+
+    The template is created once with the matching primitive operator, so
+    geometry and UVs are identical to the operator's output. It is looked up
+    by name so a scene reset (which clears bpy.data) simply rebuilds it.
+    """
+    name = PRIMITIVE_TEMPLATE_PREFIX + primitive_type
+    template = bpy.data.meshes.get(name)
+    if template is not None:
+        return template
+
+    PRIMITIVE_CREATORS[primitive_type](None)
+    obj = bpy.context.active_object
+    template = obj.data.copy()
+    template.name = name
+    _PRIMITIVE_OBJECT_NAMES[primitive_type] = obj.name
+    mesh = obj.data
+    bpy.data.batch_remove(ids=[obj, mesh])
+    return template
+
+
 def create_primitive(primitive_type: str, dimensions: List[float]) -> 'bpy.types.Object':
     """Create a mesh primitive."""
     primitive_type = primitive_type.lower().replace("_", "")
@@ -49,11 +82,91 @@ def create_primitive(primitive_type: str, dimensions: List[float]) -> 'bpy.types
     if primitive_type not in PRIMITIVE_CREATORS:
         raise ValueError(f"Unknown primitive type: {primitive_type}")
 
-    PRIMITIVE_CREATORS[primitive_type](dimensions)
-    obj = bpy.context.active_object
-
-    # Scale to dimensions
-    obj.scale = (dimensions[0], dimensions[1], dimensions[2])
-    bpy.ops.object.transform_apply(scale=True)
+    # Copy the cached template instead of running a primitive operator
+    template = _primitive_template(primitive_type)
+    mesh = template.copy()
+    mesh.name = _PRIMITIVE_OBJECT_NAMES[primitive_type]
+    obj = bpy.data.objects.new(mesh.name, mesh)
+    bpy.context.collection.objects.link(obj)
+    # Leave the new object as the only selection, as the primitive operators
+    # do; callers run selection-based operators right after
+    for selected in bpy.context.selected_objects:
+        selected.select_set(False)
+    obj.select_set(True)
+    bpy.context.view_layer.objects.active = obj
+
+    # Scale to dimensions, baked into the mesh data
+    mesh.transform(Matrix.Diagonal((dimensions[0], dimensions[1], dimensions[2], 1.0)))
+    if dimensions[0] * dimensions[1] * dimensions[2] < 0:
+        # A mirroring scale turns faces inside out; restore outward winding
+        bm = bmesh.new()
+        bm.from_mesh(mesh)
+        bmesh.ops.reverse_faces(bm, faces=bm.faces[:])
+        bm.to_mesh(mesh)
+        bm.free()
 
     return obj
+
+
+def merge_objects(target: 'bpy.types.Object', sources: List['bpy.types.Object']) -> None:
+    """
+    Merge the mesh data of sources into target and delete the sources.
+
+    This replaces the select_all/select_set/join operator sequence: no
+    operator runs and selection state is untouched. Objects are assumed to be
+    unparented, so each object's local transform places its geometry, and
+    sources do not need their transforms applied first.
+    """
+    if not sources:
+        return
+
+    target_inverse = target.matrix_basis.inverted()
+    bm = bmesh.new()
+    bm.from_mesh(target.data)
+    for source in sources:
+        first_vert = len(bm.verts)
+        first_face = len(bm.faces)
+        # from_mesh appends to a non-empty bmesh
+        bm.from_mesh(source.data)
+        bm.verts.ensure_lookup_table()
+        bm.faces.ensure_lookup_table()
+        matrix = target_inverse @ source.matrix_basis
+        bmesh.ops.transform(bm, matrix=matrix, verts=bm.verts[first_vert:])
+        if matrix.is_negative:
+            bmesh.ops.reverse_faces(bm, faces=bm.faces[first_face:])
+    bm.to_mesh(target.data)
+    bm.free()
+
+    # One batch removal instead of a depsgraph refresh per object
+    orphan_meshes = [source.data for source in sources if source.data.users == 1]
+    bpy.data.batch_remove(ids=list(sources) + orphan_meshes)
+
+
+# Collection holding short-lived helper objects (e.g. boolean cutters)
+SCRATCH_COLLECTION_NAME = "SpecCadeScratch"
+
+
+def get_scratch_collection() -> 'bpy.types.Collection':
+    """Get the scratch collection for helper objects, creating it if needed."""
+    collection = bpy.data.collections.get(SCRATCH_COLLECTION_NAME)
+    if collection is None:
+        collection = bpy.data.collections.new(SCRATCH_COLLECTION_NAME)
+        collection.hide_render = True
+        bpy.context.scene.collection.children.link(collection)
+    return collection
+
+
+def clear_scratch_collection() -> None:
+    """
+    Delete the scratch collection with all its objects and their meshes.
+
+    Everything goes in a single batch removal, so helper objects cost one
+    depsgraph/ID-user rebuild per handler instead of one per object. Call it
+    before exporting, since the collection is part of the scene.
+    """
+    collection = bpy.data.collections.get(SCRATCH_COLLECTION_NAME)
+    if collection is None:
+        return
+    objects = list(collection.all_objects)
+    meshes = [obj.data for obj in objects if obj.type == 'MESH' and obj.data.users == 1]
+    bpy.data.batch_remove(ids=objects + meshes + [collection])
@@ -0,0 +1,67 @@
+import struct
+import tempfile
+import unittest
+import zlib
+from pathlib import Path
+import sys
+
+
+# Allow `import speccade.*` from repo root.
+_BLENDER_DIR = Path(__file__).resolve().parents[2]
+if str(_BLENDER_DIR) not in sys.path:
+    sys.path.insert(0, str(_BLENDER_DIR))
+
+
+def _read_chunks(data: bytes):
+    offset = 8
+    while offset < len(data):
+        (length,) = struct.unpack(">I", data[offset:offset + 4])
+        chunk_type = data[offset + 4:offset + 8]
+        payload = data[offset + 8:offset + 8 + length]
+        (crc,) = struct.unpack(">I", data[offset + 8 + length:offset + 12 + length])
+        yield chunk_type, payload, crc
+        offset += 12 + length
+
+
+class TestEncodePngRgba8(unittest.TestCase):
+    def test_encodes_header_and_scanlines(self) -> None:
+        from speccade.image_io import encode_png_rgba8
+
+        rgba = bytes([255, 0, 0, 255, 0, 255, 0, 128, 0, 0, 255, 0, 10, 20, 30, 40])
+        data = encode_png_rgba8(rgba, 2, 2)
+
+        self.assertEqual(data[:8], b"\x89PNG\r\n\x1a\n")
+        chunks = list(_read_chunks(data))
+        self.assertEqual([c[0] for c in chunks], [b"IHDR", b"IDAT", b"IEND"])
+        for chunk_type, payload, crc in chunks:
+            self.assertEqual(zlib.crc32(chunk_type + payload) & 0xFFFFFFFF, crc)
+
+        width, height, depth, color_type = struct.unpack(">IIBB", chunks[0][1][:10])
+        self.assertEqual((width, height, depth, color_type), (2, 2, 8, 6))
+
+        raw = zlib.decompress(chunks[1][1])
+        self.assertEqual(raw, b"\x00" + rgba[:8] + b"\x00" + rgba[8:])
+
+    def test_output_is_deterministic(self) -> None:
+        from speccade.image_io import encode_png_rgba8
+
+        rgba = bytes(range(64))
+        self.assertEqual(encode_png_rgba8(rgba, 4, 4), encode_png_rgba8(rgba, 4, 4))
+
+    def test_rejects_mismatched_size(self) -> None:
+        from speccade.image_io import encode_png_rgba8
+
+        with self.assertRaises(ValueError):
+            encode_png_rgba8(b"\x00" * 12, 2, 2)
+
+    def test_write_creates_parent_dirs(self) -> None:
+        from speccade.image_io import write_png_rgba8
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "nested" / "out.png"
+            write_png_rgba8(path, b"\x00" * 4, 1, 1)
+            self.assertTrue(path.read_bytes().startswith(b"\x89PNG"))
+
+
+if __name__ == "__main__":
+    unittest.main()
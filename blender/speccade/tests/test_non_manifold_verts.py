@@ -0,0 +1,92 @@
+import unittest
+from pathlib import Path
+import sys
+from unittest import mock
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - numpy ships with Blender
+    numpy = None
+
+
+# Allow `import speccade.*` from repo root.
+_BLENDER_DIR = Path(__file__).resolve().parents[2]
+if str(_BLENDER_DIR) not in sys.path:
+    sys.path.insert(0, str(_BLENDER_DIR))
+
+
+CUBE_FACES = [
+    (0, 3, 2, 1),
+    (4, 5, 6, 7),
+    (0, 1, 5, 4),
+    (1, 2, 6, 5),
+    (2, 3, 7, 6),
+    (3, 0, 4, 7),
+]
+
+
+def _tetrahedron(a, b, c, d):
+    return [(a, c, b), (a, b, d), (b, c, d), (c, a, d)]
+
+
+@unittest.skipIf(numpy is None, "numpy not available")
+class TestCountNonManifoldVerts(unittest.TestCase):
+    def _count(self, vertex_count, faces, wire_edges=()):
+        from speccade import handlers_mesh
+
+        # Build the arrays the way Blender lays out a mesh: one edge per
+        # vertex pair, each face corner owning the edge to the next corner.
+        edge_index = {}
+        loop_verts = []
+        loop_edges = []
+        loop_prev = []
+        for face in faces:
+            start = len(loop_verts)
+            for i, vert in enumerate(face):
+                key = tuple(sorted((vert, face[(i + 1) % len(face)])))
+                loop_verts.append(vert)
+                loop_edges.append(edge_index.setdefault(key, len(edge_index)))
+                loop_prev.append(start + (i - 1) % len(face))
+        for edge in wire_edges:
+            edge_index.setdefault(tuple(sorted(edge)), len(edge_index))
+
+        edge_verts = numpy.array(list(edge_index), dtype=numpy.int64).reshape(-1, 2)
+        loop_edges = numpy.array(loop_edges, dtype=numpy.int64)
+        edge_faces = numpy.bincount(loop_edges, minlength=len(edge_verts))
+
+        # handlers_mesh only binds numpy alongside bpy; patch it in for headless runs.
+        with mock.patch.object(handlers_mesh, "np", numpy):
+            return handlers_mesh._count_non_manifold_verts(
+                vertex_count,
+                edge_verts,
+                edge_faces,
+                numpy.array(loop_verts, dtype=numpy.int64),
+                loop_edges,
+                numpy.array(loop_prev, dtype=numpy.int64),
+            )
+
+    def test_closed_cube_is_manifold(self) -> None:
+        self.assertEqual(self._count(8, CUBE_FACES), 0)
+
+    def test_bowtie_vertex(self) -> None:
+        # Two triangles touching at vertex 0 only.
+        self.assertEqual(self._count(5, [(0, 1, 2), (0, 3, 4)]), 1)
+        # Two closed tetrahedra sharing a tip: every edge has two faces,
+        # but vertex 0 has two separate fans.
+        faces = _tetrahedron(0, 1, 2, 3) + _tetrahedron(0, 4, 5, 6)
+        self.assertEqual(self._count(7, faces), 1)
+
+    def test_fin_edge_verts(self) -> None:
+        # Three triangles on edge 0-1; only its two verts are non-manifold.
+        faces = [(0, 1, 2), (1, 0, 3), (0, 1, 4)]
+        self.assertEqual(self._count(5, faces), 2)
+
+    def test_wire_edge_and_loose_verts(self) -> None:
+        # A loose edge (8-9) and a loose vertex (10) next to a closed cube.
+        self.assertEqual(self._count(11, CUBE_FACES, wire_edges=[(8, 9)]), 3)
+        # A wire edge hanging off the cube also taints its cube vertex.
+        self.assertEqual(self._count(9, CUBE_FACES, wire_edges=[(0, 8)]), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+# Allow `import speccade.*` from repo root.
+_BLENDER_DIR = Path(__file__).resolve().parents[2]
+if str(_BLENDER_DIR) not in sys.path:
+    sys.path.insert(0, str(_BLENDER_DIR))
+
+
+class TestWriteReport(unittest.TestCase):
+    def test_writes_report_fields(self) -> None:
+        from speccade.report import write_report
+
+        metrics = {"triangle_count": 12, "bounding_box": {"min": [0.0, 0.0, 0.0], "max": [1.0, 2.0, 0.5]}}
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "report.json"
+            write_report(path, ok=True, metrics=metrics, output_path="out.glb", duration_ms=0)
+            report = json.loads(path.read_text())
+
+        self.assertTrue(report["ok"])
+        self.assertEqual(report["metrics"], metrics)
+        self.assertEqual(report["output_path"], "out.glb")
+        self.assertEqual(report["duration_ms"], 0)
+        self.assertNotIn("error", report)
+
+    def test_stdlib_fallback_matches(self) -> None:
+        from speccade import report as report_mod
+
+        payload = {"ok": False, "error": "boom", "metrics": {"lods": [{"triangle_count": 3}]}}
+        encoded = report_mod._dumps(payload)
+        saved = report_mod.orjson
+        report_mod.orjson = None
+        try:
+            fallback = report_mod._dumps(payload)
+        finally:
+            report_mod.orjson = saved
+
+        self.assertEqual(json.loads(encoded), json.loads(fallback))
+
+    def test_fallback_writes_non_finite_as_null_and_keeps_utf8(self) -> None:
+        from speccade import report as report_mod
+
+        payload = {"error": "échec", "metrics": {"bbox_min": [float("inf"), float("-inf"), float("nan")]}}
+        saved = report_mod.orjson
+        report_mod.orjson = None
+        try:
+            fallback = report_mod._dumps(payload)
+        finally:
+            report_mod.orjson = saved
+
+        self.assertIn("échec".encode("utf-8"), fallback)
+        self.assertEqual(json.loads(fallback)["metrics"]["bbox_min"], [None, None, None])
+
+    @unittest.skipIf(orjson is None, "orjson not available")
+    def test_encoders_write_identical_bytes(self) -> None:
+        from speccade import report as report_mod
+
+        payload = {
+            "ok": True,
+            "error": "Ошибка: ∅",
+            "metrics": {
+                "bbox_min": [float("inf"), float("inf"), float("inf")],
+                "bbox_max": [float("-inf"), float("-inf"), float("-inf")],
+                "uv_coverage": float("nan"),
+                "materials": ["Métal", "木"],
+            },
+        }
+        encoded = report_mod._dumps(payload)
+        saved = report_mod.orjson
+        report_mod.orjson = None
+        try:
+            fallback = report_mod._dumps(payload)
+        finally:
+            report_mod.orjson = saved
+
+        self.assertEqual(encoded, fallback)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+from pathlib import Path
+import sys
+from unittest import mock
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - numpy ships with Blender
+    numpy = None
+
+
+# Allow `import speccade.*` from repo root.
+_BLENDER_DIR = Path(__file__).resolve().parents[2]
+if str(_BLENDER_DIR) not in sys.path:
+    sys.path.insert(0, str(_BLENDER_DIR))
+
+
+@unittest.skipIf(numpy is None, "numpy not available")
+class TestDetectStairCandidates(unittest.TestCase):
+    def _detect(self, heights, step_height):
+        from speccade import export
+
+        # export only binds numpy alongside bpy; patch it in for headless runs.
+        with mock.patch.object(export, "np", numpy):
+            return export._detect_stair_candidates(heights, step_height)
+
+    def test_flat_floor_has_no_stairs(self) -> None:
+        self.assertEqual(self._detect([0.0, 0.01, 0.02], 0.2), 0)
+
+    def test_counts_every_face_on_matching_steps(self) -> None:
+        # Three levels 0.2 apart with 2, 1 and 3 faces.
+        heights = [0.0, 0.01, 0.2, 0.41, 0.4, 0.39]
+        self.assertEqual(self._detect(heights, 0.2), 6)
+
+    def test_levels_split_on_sorted_gaps(self) -> None:
+        # 0.0 and 0.05 are separate levels; only 0.05 -> 0.25 is a step.
+        self.assertEqual(self._detect([0.0, 0.05, 0.25], 0.2), 2)
+        # A chain of small gaps stays one level even across a wide span.
+        heights = [i * 0.025 for i in range(9)]
+        self.assertEqual(self._detect(heights, 0.2), 0)
+
+    def test_unsorted_input(self) -> None:
+        self.assertEqual(self._detect([0.4, 0.0, 0.2], 0.2), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()